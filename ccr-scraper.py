@@ -1,103 +1,282 @@
-import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from selectolax.lexbor import LexborHTMLParser
 import re
 import os
 import time
 from urllib.parse import urljoin, urlparse
 import json
+import queue
+import threading
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, Future
+
+# Prefer the C-based lxml parser; fall back to the stdlib parser if it is missing
+try:
+    import lxml  # noqa: F401
+    PARSER = 'lxml'
+except ImportError:
+    PARSER = 'html.parser'
+
+# Patterns used on every section, compiled once
+_UNSAFE_FN = re.compile(r'[<>:"/\\|?*§.]')
+_UNSAFE_TITLE = re.compile(r'[§<>:"/\\|?*]')
+_WS = re.compile(r'\s+')
+_SUBSECTION = re.compile(r'^\([a-z]\)')
+
+# Alt text and parent class markers for formula images
+_MATH_ALT = re.compile(r'formula|equation|sum|equals|water loss', re.I)
+_FIGURE_CLS = 'figure'
+
+# Section pages only need the document body and its header, so build
+# just those subtrees instead of the whole page
+SECTION_STRAINER = SoupStrainer(['div', 'h1', 'ul'],
+                                id=['co_document', 'co_docHeaderTitle', 'co_docHeaderCitation'])
 
 class CaliforniaRegulationsScraper:
-    def __init__(self, output_dir="ca_regs_chapter_3_5"):
+    def __init__(self, output_dir="ca_regs_chapter_3_5", max_workers=8, requests_per_second=2.0,
+                 cache_name="westlaw_cache"):
         self.base_url = "https://shared-govt.westlaw.com"
-        self.session = requests.Session()
+        # Responses are cached on disk and revalidated with ETag/Last-Modified,
+        # so re-runs mostly get 304s or local hits instead of full downloads
+        self.session = requests_cache.CachedSession(cache_name, backend='sqlite',
+                                                    expire_after=86400, cache_control=True)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        # Reuse connections across threads and retry transient server errors
+        retry = Retry(total=5, backoff_factor=0.5,
+                      status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods={'GET'})
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+        self.session.mount('https://', adapter)
         self.output_dir = Path(output_dir)
         self.images_dir = self.output_dir / "images"
         self.output_dir.mkdir(exist_ok=True)
         self.images_dir.mkdir(exist_ok=True)
+        self._images_dir_str = str(self.images_dir)  # Avoids Path objects per download
+        self.max_workers = max_workers  # Concurrent page fetches
+        self._img_pool = ThreadPoolExecutor(max_workers=8)  # Formula image downloads
+        
+        # Token bucket shared by all worker threads to stay polite
+        self._rate = requests_per_second
+        self._next_ok = 0.0
+        self._rate_lock = threading.Lock()
+        self.images_cache_file = self.output_dir / "images_cache.json"
+        self._img_cache = self.load_image_cache()
+        # Images being downloaded right now, so concurrent sections that use
+        # the same formula wait for one download instead of racing
+        self._img_lock = threading.Lock()
+        self._img_inflight = {}
         
-    def get_page_content(self, url):
-        """Fetch page content with error handling"""
+        # Sections are logged one JSON line at a time as they are saved,
+        # so an interrupted run can pick up where it left off
+        self.sections_log_file = self.output_dir / "sections.jsonl"
+        self._completed = self.load_completed_sections()
+        
+        # Section files are written by a background thread so disk writes
+        # overlap with fetching and parsing the next sections
+        self._write_q = queue.Queue(maxsize=64)
+        threading.Thread(target=self._writer_loop, daemon=True).start()
+        
+    def _writer_loop(self):
+        """Write queued (filepath, chunks) pairs to disk until the process exits"""
+        while True:
+            filepath, chunks = self._write_q.get()
+            try:
+                # A 1MB buffer lets the header and body go out in one write
+                with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    f.writelines(chunks)
+            except Exception as e:
+                print(f"      Error writing {filepath}: {str(e)}")
+            finally:
+                self._write_q.task_done()
+    
+    def wait_for_rate_limit(self):
+        """Sleep only as long as needed to keep under the request rate"""
+        with self._rate_lock:
+            now = time.monotonic()
+            delay = self._next_ok - now
+            self._next_ok = max(self._next_ok, now) + 1.0 / self._rate
+        if delay > 0:
+            time.sleep(delay)
+    
+    def get_fresh_cached(self, url):
+        """Return the cached response for url if it can be used without asking the server, else None"""
+        # only_if_cached answers 504 for misses, for stale entries (which would
+        # be revalidated with the server) and when the cache is disabled
+        response = self.session.get(url, timeout=30, only_if_cached=True)
+        return None if response.status_code == 504 else response
+    
+    def fetch_page(self, url):
+        """Fetch raw page bytes with error handling"""
         try:
+            cached = self.get_fresh_cached(url)
+            if cached is not None:
+                return cached.content
+            # Everything else reaches the server, so it is rate limited
+            self.wait_for_rate_limit()
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
+            return response.content
         except Exception as e:
             print(f"Error fetching {url}: {str(e)}")
             return None
     
+    def get_page_content(self, url, parse_only=None):
+        """Fetch a page and parse it with BeautifulSoup"""
+        content = self.fetch_page(url)
+        if content is None:
+            return None
+        # Westlaw serves UTF-8, so skip bs4's encoding detection pass
+        return BeautifulSoup(content, PARSER, from_encoding='utf-8', parse_only=parse_only)
+    
+    def get_listing_tree(self, url):
+        """Fetch a listing page and parse it with selectolax"""
+        content = self.fetch_page(url)
+        if content is None:
+            return None
+        return LexborHTMLParser(content)
+    
     def extract_articles_from_chapter(self, chapter_url):
         """Extract all article links from the chapter page"""
-        soup = self.get_page_content(chapter_url)
-        if not soup:
+        tree = self.get_listing_tree(chapter_url)
+        if tree is None:
             return []
         
         articles = []
         # Find the list of articles
-        article_list = soup.find('ul', class_='co_genericWhiteBox')
-        if not article_list:
+        article_list = tree.css_first('ul.co_genericWhiteBox')
+        if article_list is None:
             print("Could not find article list")
             return []
         
-        for li in article_list.find_all('li'):
-            link = li.find('a')
-            if link and link.get('href'):
+        # Only direct children are articles; nested lists hold their sections
+        for li in article_list.iter():
+            if li.tag != 'li':
+                continue
+            link = li.css_first('a[href]')
+            href = link.attributes.get('href') if link else None
+            if href:
                 article_info = {
-                    'title': link.get_text(strip=True),
-                    'url': urljoin(self.base_url, link['href']),
+                    'title': link.text(strip=True),
+                    'url': urljoin(self.base_url, href),
                     'sections': []
                 }
+                
+                # Some chapter pages already list each article's sections,
+                # which saves fetching the article page
+                nested_list = li.css_first('ul.co_genericWhiteBox')
+                if nested_list is not None:
+                    article_info['sections'] = self.extract_section_links(nested_list)
+                    article_info['sections_prefetched'] = True
+                
                 articles.append(article_info)
         
         return articles
     
     def extract_sections_from_article(self, article_url):
         """Extract all section links from an article page"""
-        soup = self.get_page_content(article_url)
-        if not soup:
+        tree = self.get_listing_tree(article_url)
+        if tree is None:
             return []
         
-        sections = []
         # Find the list of sections
-        section_list = soup.find('ul', class_='co_genericWhiteBox')
-        if not section_list:
+        section_list = tree.css_first('ul.co_genericWhiteBox')
+        if section_list is None:
             print("Could not find section list")
             return []
         
-        for li in section_list.find_all('li'):
-            link = li.find('a')
-            if link and link.get('href'):
+        return self.extract_section_links(section_list)
+    
+    def extract_section_links(self, section_list):
+        """Extract section titles and URLs from a section list node"""
+        sections = []
+        # One selector pass yields the linked anchors directly
+        for link in section_list.css('li > a[href]'):
+            href = link.attributes.get('href')
+            if href:
                 section_info = {
-                    'title': link.get_text(strip=True),
-                    'url': urljoin(self.base_url, link['href'])
+                    'title': link.text(strip=True),
+                    'url': urljoin(self.base_url, href)
                 }
                 sections.append(section_info)
         
         return sections
     
-    def convert_subscripts_to_text(self, element):
+    def get_article_sections(self, article):
+        """Return an article's sections, fetching its page only if needed"""
+        if article.get('sections_prefetched'):
+            return article['sections']
+        return self.extract_sections_from_article(article['url'])
+    
+    def convert_subscripts_to_text(self, tags):
         """Convert HTML subscripts to underscore notation for LLM understanding"""
-        # Find all subscript tags and replace them
-        for sub in element.find_all('sub'):
-            sub_text = sub.get_text()
-            sub.replace_with(f"_{sub_text}")
-        
-        # Find all superscript tags and replace them
-        for sup in element.find_all('sup'):
-            sup_text = sup.get_text()
-            sup.replace_with(f"^{sup_text}")
-        
-        return element
+        # Tags arrive in document order; walking backwards rewrites nested
+        # tags before the tags that contain them
+        for tag in reversed(tags):
+            prefix = '_' if tag.name == 'sub' else '^'
+            tag.replace_with(f"{prefix}{tag.get_text()}")
+    
+    def load_image_cache(self):
+        """Load the image URL -> local filename map saved by a previous run"""
+        if not self.images_cache_file.exists():
+            return {}
+        try:
+            with open(self.images_cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except json.JSONDecodeError:
+            return {}  # Truncated by an interrupted run; images are re-fetched
+        # Only trust entries whose file is still on disk
+        return {url: name for url, name in cache.items() if (self.images_dir / name).exists()}
+    
+    def load_completed_sections(self):
+        """Load section records written by a previous run, keyed by URL"""
+        completed = {}
+        if not self.sections_log_file.exists():
+            return completed
+        with open(self.sections_log_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Partial line from an interrupted run
+                if (self.output_dir / record['filename']).exists():
+                    completed[record['url']] = record
+        return completed
     
     def download_image(self, img_url, section_title):
         """Download and save an image, return local filename"""
+        # The same formula image often appears in several sections, so only
+        # the first caller downloads it and the rest reuse its filename
+        with self._img_lock:
+            if img_url in self._img_cache:
+                return self._img_cache[img_url]
+            future = self._img_inflight.get(img_url)
+            first = future is None
+            if first:
+                future = self._img_inflight[img_url] = Future()
+        if not first:
+            return future.result()
+        
+        local_filename = None
+        try:
+            local_filename = self._fetch_image(img_url, section_title)
+        finally:
+            with self._img_lock:
+                if local_filename:
+                    self._img_cache[img_url] = local_filename
+                del self._img_inflight[img_url]  # A failed download can be retried
+            future.set_result(local_filename)
+        return local_filename
+    
+    def _fetch_image(self, img_url, section_title):
+        """Stream an image to the images directory, return local filename"""
         try:
             # Clean the section title for filename
-            clean_title = re.sub(r'[<>:"/\\|?*§.]', '_', section_title)
-            clean_title = re.sub(r'\s+', '_', clean_title)
+            clean_title = _WS.sub('_', _UNSAFE_FN.sub('_', section_title))
             
             # Parse the image URL to get the original filename
             parsed_url = urlparse(img_url)
@@ -107,14 +286,19 @@ class CaliforniaRegulationsScraper:
             
             # Create a descriptive filename
             local_filename = f"{clean_title}_{img_name}"
-            local_path = self.images_dir / local_filename
-            
-            # Download the image
-            response = self.session.get(img_url, timeout=30)
-            response.raise_for_status()
+            local_path = os.path.join(self._images_dir_str, local_filename)
             
-            with open(local_path, 'wb') as f:
-                f.write(response.content)
+            # Stream the image to disk instead of buffering it in memory;
+            # only requests that reach the server are rate limited
+            response = self.get_fresh_cached(img_url)
+            if response is None:
+                self.wait_for_rate_limit()
+                response = self.session.get(img_url, stream=True, timeout=30)
+            with response:
+                response.raise_for_status()
+                with open(local_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        f.write(chunk)
             
             print(f"    Downloaded image: {local_filename}")
             return local_filename
@@ -123,12 +307,13 @@ class CaliforniaRegulationsScraper:
             print(f"    Error downloading image {img_url}: {str(e)}")
             return None
     
-    def process_mathematical_images(self, soup, section_title):
+    def process_mathematical_images(self, imgs, section_title):
         """Find and download mathematical formula images"""
         images_downloaded = []
+        to_download = []
         
         # Look for images in figure blocks or mathematical contexts
-        for img in soup.find_all('img'):
+        for img in imgs:
             img_src = img.get('src')
             if img_src:
                 # Convert relative URLs to absolute
@@ -141,53 +326,76 @@ class CaliforniaRegulationsScraper:
                 
                 # Check if this looks like a mathematical formula
                 # (could be in a figure block, or have mathematical alt text)
-                img_alt = img.get('alt', '').lower()
-                parent_class = img.parent.get('class', []) if img.parent else []
+                img_alt = img.get('alt', '') or ''
+                is_math = _MATH_ALT.search(img_alt) is not None
+                if not is_math and img.parent:
+                    is_math = any(_FIGURE_CLS in cls for cls in img.parent.get('class', []))
                 
-                if (any('figure' in cls for cls in parent_class) or 
-                    'formula' in img_alt or 'equation' in img_alt or 
-                    any(word in img_alt for word in ['sum', 'equals', 'water loss'])):
-                    
-                    local_filename = self.download_image(img_url, section_title)
-                    if local_filename:
-                        images_downloaded.append({
-                            'original_url': img_url,
-                            'local_file': local_filename,
-                            'alt_text': img.get('alt', ''),
-                            'description': f"Mathematical formula from {section_title}"
-                        })
-                        
-                        # Replace the image with a text reference
-                        img.replace_with(f"\n[IMAGE: {local_filename} - {img.get('alt', 'Mathematical formula')}]\n")
+                if is_math:
+                    to_download.append((img_url, img))
+        
+        # Download the distinct images in parallel
+        img_urls = list(dict.fromkeys(img_url for img_url, _ in to_download))
+        local_filenames = dict(zip(img_urls, self._img_pool.map(
+            lambda img_url: self.download_image(img_url, section_title), img_urls)))
+        
+        # Rewrite the tree on this thread once the downloads are done
+        for img_url, img in to_download:
+            local_filename = local_filenames[img_url]
+            if local_filename:
+                images_downloaded.append({
+                    'original_url': img_url,
+                    'local_file': local_filename,
+                    'alt_text': img.get('alt', ''),
+                    'description': f"Mathematical formula from {section_title}"
+                })
+                
+                # Replace the image with a text reference
+                img.replace_with(f"\n[IMAGE: {local_filename} - {img.get('alt', 'Mathematical formula')}]\n")
         
         return images_downloaded
     
     def extract_section_content(self, section_url, section_title):
         """Extract the main content from a section page"""
-        soup = self.get_page_content(section_url)
+        soup = self.get_page_content(section_url, parse_only=SECTION_STRAINER)
         if not soup:
             return "", []
         
+        # Walk the tree once, collecting images, sub/sup tags, the document
+        # and header containers, and the content blocks
+        imgs, scripts, content_blocks = [], [], []
+        doc_content = title_section = None
+        for tag in soup.find_all(['img', 'sub', 'sup', 'div']):
+            if tag.name == 'div':
+                tag_id = tag.get('id')
+                if tag_id == 'co_document':
+                    doc_content = doc_content or tag
+                elif tag_id == 'co_docHeaderTitle':
+                    title_section = title_section or tag
+                elif 'co_contentBlock' in tag.get('class', []):
+                    content_blocks.append(tag)
+            elif tag.name == 'img':
+                imgs.append(tag)
+            else:
+                scripts.append(tag)
+        
         # Process mathematical images first
-        images = self.process_mathematical_images(soup, section_title)
+        images = self.process_mathematical_images(imgs, section_title)
         
         # Find the main document content
-        doc_content = soup.find('div', {'id': 'co_document'})
         if not doc_content:
             print(f"Could not find document content for {section_title}")
             return "", images
         
         # Extract the title and citation info
-        title_section = soup.find('div', {'id': 'co_docHeaderTitle'})
+        header = ""
         content_lines = []
         
         if title_section:
             title_h1 = title_section.find('h1')
             if title_h1:
                 title_text = title_h1.get_text(strip=True)
-                content_lines.append(title_text)
-                content_lines.append("=" * len(title_text))
-                content_lines.append("")
+                header = f"{title_text}\n{'=' * len(title_text)}\n\n"
             
             # Get citation info
             citation_ul = title_section.find('ul', {'id': 'co_docHeaderCitation'})
@@ -198,32 +406,46 @@ class CaliforniaRegulationsScraper:
                         content_lines.append(citation_text)
                 content_lines.append("")
         
-        # Extract the main content sections
-        content_blocks = doc_content.find_all('div', class_='co_contentBlock')
+        # Convert subscripts and superscripts once for the whole document
+        # rather than re-scanning every (possibly nested) block
+        self.convert_subscripts_to_text(scripts)
         
+        # Extract the main content sections
         for block in content_blocks:
+            block_classes = block.get('class', [])
+            
             # Skip certain types of blocks
-            if any(cls in block.get('class', []) for cls in ['co_documentHead', 'co_printHeading']):
+            if any(cls in block_classes for cls in ['co_documentHead', 'co_printHeading']):
+                continue
+            
+            # Section blocks are split into their paragraphs
+            if 'co_section' in block_classes:
+                self.process_section_block(block, content_lines)
                 continue
             
-            # Convert subscripts and superscripts
-            block = self.convert_subscripts_to_text(block)
+            # Extract the block text once and hand the string to the helpers
+            text = block.get_text(strip=True)
+            if not text:
+                continue
             
             # Handle different types of content blocks
-            if 'co_section' in block.get('class', []):
-                self.process_section_block(block, content_lines)
-            elif 'co_subsection' in block.get('class', []):
-                self.process_subsection_block(block, content_lines)
-            elif 'co_paragraph' in block.get('class', []):
-                self.process_paragraph_block(block, content_lines)
-            else:
+            if 'co_subsection' in block_classes:
+                self.process_subsection_block(text, content_lines)
+            elif 'co_paragraph' in block_classes:
+                self.process_paragraph_block(text, content_lines)
+            elif not text.startswith(('Note:', 'History:', 'Credits')):
                 # Generic text extraction
-                text = block.get_text(strip=True)
-                if text and not text.startswith(('Note:', 'History:', 'Credits')):
-                    content_lines.append(text)
-                    content_lines.append("")
+                content_lines.append(text)
+                content_lines.append("")
         
-        return "\n".join(content_lines), images
+        return header + "\n".join(content_lines), images
+    
+    def fetch_section(self, section):
+        """Extract one section's content; runs on a worker thread"""
+        if section['url'] in self._completed:
+            return "", []
+        
+        return self.extract_section_content(section['url'], section['title'])
     
     def process_section_block(self, block, content_lines):
         """Process a section-level content block"""
@@ -234,30 +456,26 @@ class CaliforniaRegulationsScraper:
             para_text = para.get_text(strip=True)
             if para_text:
                 # Check if this starts with a subsection identifier
-                if re.match(r'^\([a-z]\)', para_text):
+                if _SUBSECTION.match(para_text):
                     content_lines.append("")  # Add space before new subsection
                 content_lines.append(para_text)
         
         content_lines.append("")
     
-    def process_subsection_block(self, block, content_lines):
-        """Process a subsection-level content block"""
-        text = block.get_text(strip=True)
-        if text:
-            content_lines.append(text)
-            content_lines.append("")
+    def process_subsection_block(self, text, content_lines):
+        """Process the extracted text of a subsection-level content block"""
+        content_lines.append(text)
+        content_lines.append("")
     
-    def process_paragraph_block(self, block, content_lines):
-        """Process a paragraph-level content block"""
-        text = block.get_text(strip=True)
-        if text:
-            content_lines.append(text)
+    def process_paragraph_block(self, text, content_lines):
+        """Process the extracted text of a paragraph-level content block"""
+        content_lines.append(text)
     
     def create_safe_filename(self, title):
         """Create a safe filename from a title"""
         # Remove section symbol and clean up
-        clean_title = re.sub(r'[§<>:"/\\|?*]', '', title)
-        clean_title = re.sub(r'\s+', '_', clean_title.strip())
+        clean_title = _UNSAFE_TITLE.sub('', title)
+        clean_title = _WS.sub('_', clean_title.strip())
         # Limit length
         if len(clean_title) > 100:
             clean_title = clean_title[:100]
@@ -280,61 +498,79 @@ class CaliforniaRegulationsScraper:
             'images_downloaded': 0
         }
         
-        for i, article in enumerate(articles, 1):
-            print(f"\nProcessing Article {i}: {article['title']}")
-            
-            # Get all sections in this article
-            sections = self.extract_sections_from_article(article['url'])
-            article['sections'] = sections
-            print(f"  Found {len(sections)} sections")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor, \
+                open(self.sections_log_file, 'a', encoding='utf-8') as sections_log:
+            # Fetch the section lists for all articles concurrently
+            section_lists = list(executor.map(self.get_article_sections, articles))
             
-            article_info = {
-                'title': article['title'],
-                'url': article['url'],
-                'sections': []
-            }
+            # Queue every section up front; results come back in order per article
+            section_results = [executor.map(self.fetch_section, sections) for sections in section_lists]
             
-            for j, section in enumerate(sections, 1):
-                print(f"    Processing Section {j}: {section['title']}")
+            for i, (article, sections, results) in enumerate(zip(articles, section_lists, section_results), 1):
+                print(f"\nProcessing Article {i}: {article['title']}")
+                article['sections'] = sections
+                print(f"  Found {len(sections)} sections")
                 
-                # Extract content from this section
-                content, images = self.extract_section_content(section['url'], section['title'])
+                article_info = {
+                    'title': article['title'],
+                    'url': article['url'],
+                    'sections': []
+                }
                 
-                if content:
-                    # Save individual section file
-                    filename = f"article_{i}_section_{j}_{self.create_safe_filename(section['title'])}.txt"
-                    filepath = self.output_dir / filename
-                    
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(f"CALIFORNIA CODE OF REGULATIONS\n")
-                        f.write(f"Title 23. Waters\n")
-                        f.write(f"Division 3. State Water Resources Control Board and Regional Water Quality Control Boards\n")
-                        f.write(f"Chapter 3.5. Urban Water Use Efficiency and Conservation\n")
-                        f.write(f"Article {i}: {article['title']}\n")
-                        f.write(f"URL: {section['url']}\n")
-                        f.write("=" * 80 + "\n\n")
-                        f.write(content)
+                for j, (section, (content, images)) in enumerate(zip(sections, results), 1):
+                    print(f"    Processing Section {j}: {section['title']}")
                     
-                    print(f"      ✓ Saved: {filename}")
+                    if section['url'] in self._completed:
+                        # Saved by a previous run
+                        section_record = self._completed[section['url']]
+                        print(f"      ✓ Already saved: {section_record['filename']}")
+                    elif content:
+                        # Save individual section file
+                        filename = f"article_{i}_section_{j}_{self.create_safe_filename(section['title'])}.txt"
+                        filepath = self.output_dir / filename
+                        
+                        self._write_q.put((filepath, [
+                            f"CALIFORNIA CODE OF REGULATIONS\n",
+                            f"Title 23. Waters\n",
+                            f"Division 3. State Water Resources Control Board and Regional Water Quality Control Boards\n",
+                            f"Chapter 3.5. Urban Water Use Efficiency and Conservation\n",
+                            f"Article {i}: {article['title']}\n",
+                            f"URL: {section['url']}\n",
+                            "=" * 80 + "\n\n",
+                            content
+                        ]))
+                        
+                        print(f"      ✓ Saved: {filename}")
+                        
+                        section_record = {
+                            'title': section['title'],
+                            'url': section['url'],
+                            'filename': filename,
+                            'images': [img['local_file'] for img in images],
+                            'image_metadata': images
+                        }
+                        sections_log.write(json.dumps(section_record, ensure_ascii=False) + '\n')
+                        sections_log.flush()
+                    else:
+                        print(f"      ✗ No content extracted")
+                        continue
                     
                     # Track images
-                    all_images.extend(images)
+                    all_images.extend(section_record['image_metadata'])
                     
                     section_info = {
-                        'title': section['title'],
-                        'url': section['url'],
-                        'filename': filename,
-                        'images': [img['local_file'] for img in images]
+                        'title': section_record['title'],
+                        'url': section_record['url'],
+                        'filename': section_record['filename'],
+                        'images': section_record['images']
                     }
                     article_info['sections'].append(section_info)
                     scraping_log['total_sections'] += 1
-                    
-                else:
-                    print(f"      ✗ No content extracted")
                 
-                time.sleep(1)  # Be respectful to the server
-            
-            scraping_log['articles'].append(article_info)
+                scraping_log['articles'].append(article_info)
+        
+        # Make sure every section file has been written
+        self._write_q.join()
         
         # Save metadata and image information
         scraping_log['images_downloaded'] = len(all_images)
@@ -350,6 +586,13 @@ class CaliforniaRegulationsScraper:
             with open(images_file, 'w', encoding='utf-8') as f:
                 json.dump(all_images, f, indent=2, ensure_ascii=False)
         
+        # Save the image cache so later runs can skip known images. It goes
+        # to a temp file first so an interrupted write can't truncate it.
+        tmp_file = self.images_cache_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self._img_cache, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, self.images_cache_file)
+        
         print(f"\n{'='*60}")
         print(f"Scraping complete!")
         print(f"Total articles: {len(articles)}")
@@ -1,11 +1,21 @@
-import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
 import re
+import io
 import os
 import time
 from urllib.parse import urljoin, urlparse, parse_qs
-import json
+import orjson
+import argparse
+import contextlib
+from datetime import timedelta
 from typing import List, Dict, Tuple
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # ===== CONFIGURATION SECTION =====
 # Add code sections to scrape here
@@ -28,8 +38,11 @@ CODE_SECTIONS_TO_SCRAPE = [
 
 # Base configuration
 BASE_URL = "https://leginfo.legislature.ca.gov"
-REQUEST_DELAY = 1  # seconds between requests
+REQUEST_DELAY = 1  # seconds between requests (shared across all worker threads)
+MAX_WORKERS = 6  # concurrent page fetches
 OUTPUT_BASE_DIR = "california_legal_codes"
+CACHE_NAME = "leginfo_cache"  # on-disk HTTP cache (SQLite), reused across runs
+CACHE_EXPIRE_AFTER = timedelta(days=7)  # legal code text rarely changes
 
 # Headers for requests
 HEADERS = {
@@ -38,33 +51,219 @@ HEADERS = {
 
 # ===== END CONFIGURATION =====
 
+# urllib3 only decodes Brotli when a brotli module is importable, so only
+# advertise it then; otherwise keep requests' default gzip/deflate
+try:
+    import brotli  # noqa: F401
+    HEADERS['Accept-Encoding'] = 'br, gzip, deflate'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        HEADERS['Accept-Encoding'] = 'br, gzip, deflate'
+    except ImportError:
+        pass
+
+# One keep-alive session for every request to leginfo, so the TCP/TLS
+# connection is reused instead of re-established per page. Successful
+# responses are cached on disk so re-runs skip the network entirely.
+SESSION = requests_cache.CachedSession(CACHE_NAME, backend='sqlite',
+                                       expire_after=CACHE_EXPIRE_AFTER,
+                                       allowable_codes=(200,))
+SESSION.headers.update(HEADERS)
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5,
+                      status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods={'GET'})
+))
+
+# Patterns and tables used for every section and file, built once
+_SECTION_NUM_RE = re.compile(r'^\d+(?:\.\d+)*$')
+_FILENAME_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+# Listing pages nest each entry's title div directly inside its link,
+# indented by depth: 20px parts, 30px chapters, 40px articles
+_INDENT_RE = re.compile(r'margin-left:(\d+)px')
+
+class ListingCollector:
+    """lxml parser target that collects the links of an expanded-branch listing
+    
+    The page is streamed through the parser's callbacks, so no tree is ever
+    built. Each link inside div#expandedbranchcodesid that has an indented
+    title div becomes a dict with its href, indent (px), title and range text.
+    The title and the first float:right range div anywhere in the link are
+    read independently, so a range nested inside the title div, e.g.
+    <a><div style="margin-left:20px">PART 1.<div style="float:right">6000-6008</div></div></a>,
+    is still found (and, as with get_text/text(strip=True), is part of the title).
+    """
+    
+    def __init__(self):
+        self.found = False  # whether the listing container was seen
+        self.entries = []
+        self._listing_divs = 0  # open divs inside the listing container
+        self._entry = None  # entry for the link being read
+        self._depth = 0  # element depth inside that link
+        self._open = {}  # entry field -> (depth of its div, text fragments)
+        self._chunks = []
+    
+    def _flush(self):
+        # lxml can split one text node across several data() calls, so
+        # chunks are joined and stripped at the next node boundary
+        if self._chunks:
+            fragment = ''.join(self._chunks).strip()
+            if fragment:
+                for _, fragments in self._open.values():
+                    fragments.append(fragment)
+            self._chunks = []
+    
+    def start(self, tag, attrib):
+        self._flush()
+        if not self._listing_divs:
+            if tag == 'div' and attrib.get('id') == 'expandedbranchcodesid':
+                self.found = True
+                self._listing_divs = 1
+            return
+        if tag == 'div':
+            self._listing_divs += 1
+        
+        if self._entry is None:
+            if tag == 'a' and 'href' in attrib:
+                self._entry = {'href': attrib['href'], 'indent': None, 'title': None, 'range': None}
+                self._depth = 0
+                self._open = {}
+            return
+        
+        self._depth += 1
+        if tag != 'div':
+            return
+        style = attrib.get('style', '')
+        indent = _INDENT_RE.search(style)
+        if self._depth == 1 and indent and self._entry['title'] is None and 'title' not in self._open:
+            self._entry['indent'] = int(indent.group(1))
+            self._open['title'] = (self._depth, [])
+        if 'float:right' in style and self._entry['range'] is None and 'range' not in self._open:
+            self._open['range'] = (self._depth, [])
+    
+    def end(self, tag):
+        self._flush()
+        if not self._listing_divs:
+            return
+        if tag == 'div':
+            self._listing_divs -= 1
+        
+        if self._entry is None:
+            return
+        if self._depth == 0:
+            # The link itself is closing
+            if self._entry['title'] is not None:
+                if self._entry['range'] is None:
+                    self._entry['range'] = ""
+                self.entries.append(self._entry)
+            self._entry = None
+            return
+        for field, (depth, fragments) in list(self._open.items()):
+            if depth == self._depth:
+                self._entry[field] = ''.join(fragments)
+                del self._open[field]
+        self._depth -= 1
+    
+    def data(self, text):
+        if self._open:
+            self._chunks.append(text)
+    
+    def comment(self, text):
+        self._flush()
+    
+    def close(self):
+        return self.entries if self.found else None
+
+def parse_listing(content: bytes) -> List[Dict]:
+    """Collect the entries of a listing page, or None if it has no listing"""
+    if not content:
+        return None
+    parser = etree.HTMLParser(target=ListingCollector(), encoding='utf-8')
+    return etree.fromstring(content, parser)
+
+# Content pages are parsed straight into lxml and queried with XPath, so the
+# tree walks and text concatenation run in libxml2. leginfo serves UTF-8, and
+# libxml2 would otherwise fall back to Latin-1 on pages without a meta charset.
+CONTENT_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+_LEFT_MARGIN_XPATH = etree.XPath(
+    './/div[contains(concat(" ", normalize-space(@class), " "), " displaycodeleftmargin ")]')
+_HEADERS_XPATH = etree.XPath('.//h3 | .//h4 | .//h5')
+_SECTION_DIVS_XPATH = etree.XPath('.//div[@align="left"]')
+
+def element_text(element) -> str:
+    """Concatenate an element's stripped text fragments (like bs4's get_text(strip=True))"""
+    return ''.join(s.strip() for s in element.itertext())
+
+class RateLimiter:
+    """Spaces requests at least min_interval seconds apart across all threads"""
+    
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+    
+    def acquire(self):
+        """Block only until this caller's slot comes up"""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(self._next, now) + self.min_interval
+        if delay > 0:
+            time.sleep(delay)
+
+RATE_LIMITER = RateLimiter(REQUEST_DELAY)
+
+def get_fresh_cached(url: str):
+    """Return the cached response for url if it can be used without asking the server, else None"""
+    # only_if_cached answers 504 for misses, for stale entries (which would
+    # be revalidated with the server) and when the cache is disabled
+    response = SESSION.get(url, timeout=30, only_if_cached=True)
+    return None if response.status_code == 504 else response
+
+def fetch_page(url: str) -> bytes:
+    """Fetch a page body, waiting for a request slot unless it's a fresh cache hit"""
+    cached = get_fresh_cached(url)
+    if cached is not None:
+        return cached.content
+    # Everything else reaches the server, so it is rate limited
+    RATE_LIMITER.acquire()
+    # Stream so the connection goes back to the pool as soon as the body is
+    # read, and no Response object outlives the call holding a second reference
+    with SESSION.get(url, timeout=30, stream=True) as response:
+        response.raise_for_status()
+        return response.content
+
+# Listing pages are memoized for the rest of the run, so a branch reached
+# twice (the site cross-links some) is only fetched once. They are small, so
+# keeping the bytes is cheap; content pages are each queued once and aren't kept.
+@functools.lru_cache(maxsize=256)
+def fetch_listing_page(url: str) -> bytes:
+    """Fetch a table-of-contents page, at most once per run"""
+    return fetch_page(url)
+
 def get_division_structure(code: str, division: str, specific_parts: List[str] = None) -> List[Dict]:
     """Get the structure of a division including all its parts"""
     url = f"{BASE_URL}/faces/codes_displayexpandedbranch.xhtml?tocCode={code}&division={division}.&title=&part=&chapter=&article="
     
     print(f"Fetching division structure from: {url}")
-    response = requests.get(url, headers=HEADERS)
-    response.raise_for_status()
-    
-    soup = BeautifulSoup(response.content, 'html.parser')
+    entries = parse_listing(fetch_listing_page(url))
     
     parts_info = []
     
-    content_div = soup.find('div', {'id': 'expandedbranchcodesid'})
-    if not content_div:
+    if entries is None:
         print(f"Could not find the main content div for {code} Division {division}")
         return []
     
-    # Find all anchor tags that might contain parts
-    for anchor in content_div.find_all('a', href=True):
-        href = anchor['href']
-        
-        # Look for divs within the anchor that have the part text
-        part_div = anchor.find('div', style=lambda x: x and 'margin-left:20px' in x)
-        if not part_div:
+    # Parts are the 20px-indented entries
+    for entry in entries:
+        if entry['indent'] != 20:
             continue
-            
-        link_text = part_div.get_text(strip=True)
+        href = entry['href']
+        link_text = entry['title']
         
         # Must contain "PART" in the text
         if 'PART' not in link_text.upper():
@@ -87,8 +286,7 @@ def get_division_structure(code: str, division: str, specific_parts: List[str] =
             continue
             
         # Get the range if it exists (e.g., "116270-117130")
-        range_div = anchor.find('div', style=lambda x: x and 'float:right' in x)
-        range_text = range_div.get_text(strip=True) if range_div else ""
+        range_text = entry['range']
         
         part_info = {
             'url': urljoin(BASE_URL, href),
@@ -107,28 +305,31 @@ def get_division_structure(code: str, division: str, specific_parts: List[str] =
     return parts_info
 
 def get_chapters_for_part(part_url: str, code: str, division: str, part: str) -> List[Dict]:
-    """Get all chapters for a part that has expandable chapters"""
-    print(f"    Fetching chapters from: {part_url}")
-    response = requests.get(part_url, headers=HEADERS)
-    response.raise_for_status()
+    """Get all chapters for a part that has expandable chapters
     
-    soup = BeautifulSoup(response.content, 'html.parser')
+    When the part page already lists a chapter's articles, they are attached
+    to the chapter here so its own page doesn't need to be fetched.
+    """
+    print(f"    Fetching chapters from: {part_url}")
+    entries = parse_listing(fetch_listing_page(part_url))
     chapters = []
+    inline_articles = {}
     
-    content_div = soup.find('div', {'id': 'expandedbranchcodesid'})
-    if not content_div:
+    if entries is None:
         return chapters
     
-    # Find all anchor tags that might contain chapters
-    for anchor in content_div.find_all('a', href=True):
-        href = anchor['href']
-        
-        # Look for divs within the anchor that have the chapter text
-        chapter_div = anchor.find('div', style=lambda x: x and 'margin-left:30px' in x)
-        if not chapter_div:
+    # Chapters are the 30px-indented entries; any 40px ones are their articles
+    for entry in entries:
+        if entry['indent'] == 40:
+            article_info = parse_article_entry(entry, code, division)
+            if article_info:
+                inline_articles.setdefault(article_info['chapter'], []).append(article_info)
+            continue
+        if entry['indent'] != 30:
             continue
-            
-        link_text = chapter_div.get_text(strip=True)
+        
+        href = entry['href']
+        link_text = entry['title']
         
         # Skip reserved chapters
         if '(Reserved)' in link_text:
@@ -147,8 +348,7 @@ def get_chapters_for_part(part_url: str, code: str, division: str, part: str) ->
             continue
         
         # Get the range if it exists
-        range_div = anchor.find('div', style=lambda x: x and 'float:right' in x)
-        range_text = range_div.get_text(strip=True) if range_div else ""
+        range_text = entry['range']
         
         # Chapters can either be expandable (with articles) or direct content
         if 'codes_displayexpandedbranch.xhtml' in href:
@@ -182,123 +382,127 @@ def get_chapters_for_part(part_url: str, code: str, division: str, part: str) ->
             chapters.append(chapter_info)
             print(f"      Found chapter with direct content: {link_text} ({range_text})")
     
+    for chapter_info in chapters:
+        if chapter_info['has_articles']:
+            chapter_info['articles'] = inline_articles.get(chapter_info['chapter'], [])
+    
     return chapters
 
+def parse_article_entry(entry: Dict, code: str, division: str) -> Dict:
+    """Build the info for a 40px listing entry, or return None if it isn't an article"""
+    href = entry['href']
+    link_text = entry['title']
+    
+    # Look for article links with actual content
+    if 'codes_displayText.xhtml' not in href or 'ARTICLE' not in link_text.upper():
+        return None
+    
+    parsed = urlparse(href)
+    params = parse_qs(parsed.query)
+    
+    # Get the range if it exists
+    range_text = entry['range']
+    
+    article_info = {
+        'url': urljoin(BASE_URL, href),
+        'title': link_text,
+        'code': code,
+        'division': division,
+        'part': params.get('part', [''])[0],
+        'chapter': params.get('chapter', [''])[0],
+        'article': params.get('article', [''])[0],
+        'range': range_text
+    }
+    print(f"          Found article: {link_text} ({range_text})")
+    return article_info
+
 def get_articles_for_chapter(chapter_url: str, code: str, division: str, part: str, chapter: str) -> List[Dict]:
-    """Get all articles for a chapter that has expandable articles"""
+    """Get all articles for a chapter whose articles weren't listed on its part page"""
     print(f"        Fetching articles from: {chapter_url}")
-    response = requests.get(chapter_url, headers=HEADERS)
-    response.raise_for_status()
-    
-    soup = BeautifulSoup(response.content, 'html.parser')
+    entries = parse_listing(fetch_listing_page(chapter_url))
     articles = []
     
-    content_div = soup.find('div', {'id': 'expandedbranchcodesid'})
-    if not content_div:
+    if entries is None:
         return articles
     
-    # Find all anchor tags that might contain articles
-    for anchor in content_div.find_all('a', href=True):
-        href = anchor['href']
-        
-        # Look for divs within the anchor that have the article text
-        article_div = anchor.find('div', style=lambda x: x and 'margin-left:40px' in x)
-        if not article_div:
+    # Articles are the 40px-indented entries
+    for entry in entries:
+        if entry['indent'] != 40:
             continue
-            
-        link_text = article_div.get_text(strip=True)
-        
-        # Look for article links with actual content
-        if 'codes_displayText.xhtml' in href and 'ARTICLE' in link_text.upper():
-            parsed = urlparse(href)
-            params = parse_qs(parsed.query)
-            
-            # Get the range if it exists
-            range_div = anchor.find('div', style=lambda x: x and 'float:right' in x)
-            range_text = range_div.get_text(strip=True) if range_div else ""
-            
-            article_info = {
-                'url': urljoin(BASE_URL, href),
-                'title': link_text,
-                'code': code,
-                'division': division,
-                'part': params.get('part', [''])[0],
-                'chapter': params.get('chapter', [''])[0],
-                'article': params.get('article', [''])[0],
-                'range': range_text
-            }
+        article_info = parse_article_entry(entry, code, division)
+        if article_info:
             articles.append(article_info)
-            print(f"          Found article: {link_text} ({range_text})")
     
     return articles
 
-def parse_legal_code_html(soup: BeautifulSoup) -> str:
+def parse_legal_code_html(root: lxml.html.HtmlElement) -> str:
     """Parse California legal code HTML structure to extract formatted text"""
-    output = []
+    buf = io.StringIO()
     
-    # Find the main content container
-    main_div = soup.find('div', {'id': 'manylawsections'})
-    if not main_div:
-        main_div = soup.find('div', {'id': 'display_code_many_law_sections'})
-        if not main_div:
-            main_div = soup.find('div', class_='displaycodeleftmargin')
+    def emit(line: str):
+        # Lines are newline-separated, with no trailing newline
+        if buf.tell():
+            buf.write('\n')
+        buf.write(line)
     
-    if not main_div:
+    # Find the main content container
+    main_div = root.find('.//div[@id="manylawsections"]')
+    if main_div is None:
+        main_div = root.find('.//div[@id="display_code_many_law_sections"]')
+        if main_div is None:
+            matches = _LEFT_MARGIN_XPATH(root)
+            main_div = matches[0] if matches else None
+    
+    if main_div is None:
         return ""
     
     # Process headers (Code title, Division, Part info)
-    headers = main_div.find_all(['h3', 'h4', 'h5'])
-    for header in headers:
-        header_text = header.get_text(strip=True)
+    for header in _HEADERS_XPATH(main_div):
+        header_text = element_text(header)
         if header_text:
-            output.append(header_text)
+            emit(header_text)
             
-            # Look for citation info immediately after header
-            next_elem = header.next_sibling
-            while next_elem and isinstance(next_elem, str):
-                next_elem = next_elem.next_sibling
+            # Look for citation info immediately after header (skipping comments)
+            next_elem = header.getnext()
+            while next_elem is not None and not isinstance(next_elem.tag, str):
+                next_elem = next_elem.getnext()
             
-            if next_elem and hasattr(next_elem, 'name'):
-                if next_elem.name == 'i' or (next_elem.name == 'text' and next_elem.parent.name == 'i'):
-                    citation_text = next_elem.get_text(strip=True)
-                    if citation_text:
-                        output.append(f"  {citation_text}")
+            if next_elem is not None and next_elem.tag == 'i':
+                citation_text = element_text(next_elem)
+                if citation_text:
+                    emit(f"  {citation_text}")
             
-            output.append("")  # Blank line after header
+            emit("")  # Blank line after header
     
     # Process sections
-    section_divs = main_div.find_all('div', {'align': 'left'})
-    
-    for div in section_divs:
+    for div in _SECTION_DIVS_XPATH(main_div):
         # Skip if this is a header div
-        if div.find(['h3', 'h4', 'h5']):
+        if _HEADERS_XPATH(div):
             continue
             
         # Look for section number in h6 tag
-        h6 = div.find('h6')
-        if h6:
+        h6 = div.find('.//h6')
+        if h6 is not None:
             # Extract section number
-            section_link = h6.find('a')
-            if section_link:
-                section_num = section_link.get_text(strip=True).rstrip('.')
+            section_link = h6.find('.//a')
+            if section_link is not None:
+                section_num = element_text(section_link).rstrip('.')
                 
                 # Only process if this looks like a section number
-                if re.match(r'^\d+(?:\.\d+)*$', section_num):
-                    output.append(f"\n{section_num}.")
-                    
-                    # Get all the p tags in this section div
-                    p_tags = div.find_all('p')
+                if _SECTION_NUM_RE.match(section_num):
+                    emit(f"\n{section_num}.")
                     
                     section_texts = []
                     citation_text = None
                     
-                    for p in p_tags:
-                        p_text = p.get_text(strip=True)
+                    # Get all the p tags in this section div
+                    for p in div.iterfind('.//p'):
+                        p_text = element_text(p)
                         
                         if p_text:
                             # Check if this is a citation (has specific style or contains italic)
                             style = p.get('style', '')
-                            if 'font-size:0.9em' in style or p.find('i'):
+                            if 'font-size:0.9em' in style or p.find('.//i') is not None:
                                 citation_text = p_text
                             elif 'display:inline' in style or 'margin:0' in style:
                                 # This is regular section text
@@ -308,27 +512,61 @@ def parse_legal_code_html(soup: BeautifulSoup) -> str:
                     if section_texts:
                         combined_text = ' '.join(section_texts)
                         # Remove section number if it appears at the start
-                        combined_text = re.sub(f'^{section_num}\.?\\s*', '', combined_text)
-                        output.append(f" {combined_text}")
+                        if combined_text.startswith(section_num):
+                            combined_text = combined_text[len(section_num):].removeprefix('.').lstrip()
+                        emit(f" {combined_text}")
                     
                     # Add citation if found
                     if citation_text:
-                        output.append(f"\n{citation_text}")
+                        emit(f"\n{citation_text}")
     
-    return '\n'.join(output)
+    return buf.getvalue()
 
 def scrape_content(url: str) -> str:
     """Scrape content from a given URL"""
-    response = requests.get(url, headers=HEADERS)
-    response.raise_for_status()
-    
-    soup = BeautifulSoup(response.content, 'html.parser')
+    # The page body is dropped as soon as it is parsed, so only the
+    # lxml tree is held while the text is extracted
+    root = lxml.html.document_fromstring(fetch_page(url), parser=CONTENT_PARSER)
     
     # Use the specialized parser for legal code
-    content_text = parse_legal_code_html(soup)
+    content_text = parse_legal_code_html(root)
     
     return content_text
 
+def scrape_item(info: Dict, output_dir: str, code_name: str) -> Tuple[str, Exception]:
+    """Scrape one item and save it, returning (filename, error) for use in a worker thread
+    
+    The filename is empty if the page had no content. Writing from the worker
+    lets the file I/O overlap other workers' fetches.
+    """
+    try:
+        content = scrape_content(info['url'])
+        if not content:
+            return "", None
+        return write_item(output_dir, info, content, code_name), None
+    except Exception as e:
+        return "", e
+
+def write_item(output_dir: str, info: Dict, content: str, code_name: str) -> str:
+    """Write a scraped item with its header to its own file, returning the filename"""
+    location = f"Division {info['division']}, Part {info['part']}"
+    if 'chapter' in info:
+        location += f", Chapter {info['chapter']}"
+    if 'article' in info:
+        location += f", Article {info['article']}"
+    
+    header = (f"{code_name.upper()} - {info['code']}\n"
+              f"{location}\n"
+              f"Title: {info['title']}\n"
+              f"URL: {info['url']}\n"
+              + "=" * 80 + "\n\n")
+    
+    filename = create_filename(info)
+    with open(os.path.join(output_dir, filename), 'wb') as f:
+        f.write((header + content).encode('utf-8'))
+    
+    return filename
+
 def create_filename(info: Dict) -> str:
     """Create a safe filename for the content"""
     code = info.get('code', 'unknown')
@@ -339,8 +577,9 @@ def create_filename(info: Dict) -> str:
     title = info['title']
     
     # Clean the title for use in filename
-    title_clean = re.sub(r'[<>:"/\\|?*]', '_', title)
-    title_clean = re.sub(r'\s+', '_', title_clean)
+    # One translate pass for unsafe characters; split/join turns each
+    # whitespace run into a single underscore
+    title_clean = '_'.join(title.translate(_FILENAME_TABLE).split())
     title_clean = title_clean[:50]  # Limit length
     
     if article:
@@ -383,131 +622,117 @@ def scrape_code_section(config: Dict) -> Tuple[int, int]:
     successful_downloads = 0
     total_items = 0
     
-    # Process each part
-    for part_info in parts:
-        print(f"\nProcessing Part {part_info['part']}: {part_info['title']}")
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # Discovery runs breadth-first: each page's children are queued as
+        # soon as it is parsed, and content pages are queued for scraping
+        # the moment they are found, so scraping overlaps discovery
+        content_futures = {}
         
-        if part_info['has_chapters']:
-            # This part has chapters, need to expand it first
-            print(f"  Expanding to get chapters...")
-            chapters = get_chapters_for_part(part_info['url'], code, division, part_info['part'])
+        def queue_content(info):
+            content_futures[id(info)] = executor.submit(scrape_item, info, output_dir, code_name)
+        
+        chapter_futures = {}
+        for part_info in parts:
+            if part_info['has_chapters']:
+                future = executor.submit(get_chapters_for_part, part_info['url'], code, division, part_info['part'])
+                chapter_futures[future] = part_info
+            else:
+                queue_content(part_info)
+        print(f"Expanding {len(chapter_futures)} parts to get chapters...")
+        
+        article_futures = {}
+        for future in as_completed(chapter_futures):
+            part_info = chapter_futures[future]
+            part_info['chapters'] = future.result()
+            for chapter in part_info['chapters']:
+                if chapter.get('has_articles') and chapter['articles']:
+                    # Already listed on the part page
+                    for article in chapter['articles']:
+                        queue_content(article)
+                elif chapter.get('has_articles'):
+                    article_future = executor.submit(get_articles_for_chapter, chapter['url'], code, division,
+                                                     chapter['part'], chapter['chapter'])
+                    article_futures[article_future] = chapter
+                else:
+                    queue_content(chapter)
+        print(f"Expanding {len(article_futures)} chapters to get articles...")
+        
+        for future in as_completed(article_futures):
+            chapter = article_futures[future]
+            chapter['articles'] = future.result()
+            for article in chapter['articles']:
+                queue_content(article)
+        
+        # Process each part
+        for part_info in parts:
+            print(f"\nProcessing Part {part_info['part']}: {part_info['title']}")
             
-            if chapters:
-                print(f"  Found {len(chapters)} chapters")
-                part_info['chapters'] = chapters
+            if part_info['has_chapters']:
+                chapters = part_info['chapters']
                 
-                # Process each chapter
-                for chapter in chapters:
-                    if chapter.get('has_articles'):
-                        # This chapter has articles, need to expand it
-                        print(f"    Chapter {chapter['chapter']} has articles, expanding...")
-                        articles = get_articles_for_chapter(chapter['url'], code, division, 
-                                                          chapter['part'], chapter['chapter'])
-                        
-                        if articles:
-                            print(f"      Found {len(articles)} articles")
-                            chapter['articles'] = articles
+                if chapters:
+                    print(f"  Found {len(chapters)} chapters")
+                    
+                    # Process each chapter
+                    for chapter in chapters:
+                        if chapter.get('has_articles'):
+                            articles = chapter['articles']
                             
-                            # Scrape each article
-                            for article in articles:
-                                total_items += 1
-                                all_content.append(article)
+                            if articles:
+                                print(f"    Chapter {chapter['chapter']} has {len(articles)} articles")
                                 
-                                try:
-                                    print(f"        Scraping article: {article['title'][:60]}...")
-                                    content = scrape_content(article['url'])
+                                # Save each article
+                                for article in articles:
+                                    total_items += 1
+                                    all_content.append(article)
+                                    filename, error = content_futures[id(article)].result()
                                     
-                                    if content:
-                                        filename = create_filename(article)
-                                        filepath = os.path.join(output_dir, filename)
-                                        
-                                        with open(filepath, 'w', encoding='utf-8') as f:
-                                            f.write(f"{code_name.upper()} - {code}\n")
-                                            f.write(f"Division {article['division']}, Part {article['part']}, ")
-                                            f.write(f"Chapter {article['chapter']}, Article {article['article']}\n")
-                                            f.write(f"Title: {article['title']}\n")
-                                            f.write(f"URL: {article['url']}\n")
-                                            f.write("=" * 80 + "\n\n")
-                                            f.write(content)
-                                        
+                                    print(f"        Scraped article: {article['title'][:60]}...")
+                                    if error:
+                                        print(f"          ✗ Error: {str(error)}")
+                                    elif filename:
                                         print(f"          ✓ Saved: {filename}")
                                         successful_downloads += 1
                                     else:
                                         print(f"          ✗ No content found")
-                                    
-                                    time.sleep(REQUEST_DELAY)
-                                    
-                                except Exception as e:
-                                    print(f"          ✗ Error: {str(e)}")
+                            else:
+                                print(f"    Chapter {chapter['chapter']}: no articles found")
                         else:
-                            print(f"      No articles found")
-                    else:
-                        # This chapter has direct content
-                        total_items += 1
-                        all_content.append(chapter)
-                        
-                        try:
-                            print(f"    Scraping chapter: {chapter['title'][:60]}...")
-                            content = scrape_content(chapter['url'])
+                            # This chapter has direct content
+                            total_items += 1
+                            all_content.append(chapter)
+                            filename, error = content_futures[id(chapter)].result()
                             
-                            if content:
-                                filename = create_filename(chapter)
-                                filepath = os.path.join(output_dir, filename)
-                                
-                                with open(filepath, 'w', encoding='utf-8') as f:
-                                    f.write(f"{code_name.upper()} - {code}\n")
-                                    f.write(f"Division {chapter['division']}, Part {chapter['part']}, Chapter {chapter['chapter']}\n")
-                                    f.write(f"Title: {chapter['title']}\n")
-                                    f.write(f"URL: {chapter['url']}\n")
-                                    f.write("=" * 80 + "\n\n")
-                                    f.write(content)
-                                
+                            print(f"    Scraped chapter: {chapter['title'][:60]}...")
+                            if error:
+                                print(f"      ✗ Error: {str(error)}")
+                            elif filename:
                                 print(f"      ✓ Saved: {filename}")
                                 successful_downloads += 1
                             else:
                                 print(f"      ✗ No content found")
-                            
-                            time.sleep(REQUEST_DELAY)
-                            
-                        except Exception as e:
-                            print(f"      ✗ Error: {str(e)}")
+                else:
+                    print(f"  No chapters found for this part")
             else:
-                print(f"  No chapters found for this part")
-        else:
-            # This part links directly to content (no chapters)
-            total_items += 1
-            all_content.append(part_info)
-            
-            try:
-                print(f"  Scraping part directly (no chapters)...")
-                content = scrape_content(part_info['url'])
+                # This part links directly to content (no chapters)
+                total_items += 1
+                all_content.append(part_info)
+                filename, error = content_futures[id(part_info)].result()
                 
-                if content:
-                    filename = create_filename(part_info)
-                    filepath = os.path.join(output_dir, filename)
-                    
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(f"{code_name.upper()} - {code}\n")
-                        f.write(f"Division {part_info['division']}, Part {part_info['part']}\n")
-                        f.write(f"Title: {part_info['title']}\n")
-                        f.write(f"URL: {part_info['url']}\n")
-                        f.write("=" * 80 + "\n\n")
-                        f.write(content)
-                    
+                print(f"  Scraped part directly (no chapters)...")
+                if error:
+                    print(f"    ✗ Error: {str(error)}")
+                elif filename:
                     print(f"    ✓ Saved: {filename}")
                     successful_downloads += 1
                 else:
                     print(f"    ✗ No content found")
-                
-                time.sleep(REQUEST_DELAY)
-                
-            except Exception as e:
-                print(f"    ✗ Error: {str(e)}")
     
     # Save the structure for this code section
     structure_file = os.path.join(output_dir, f"{code}_division_{division}_structure.json")
-    with open(structure_file, 'w', encoding='utf-8') as f:
-        json.dump(parts, f, indent=2, ensure_ascii=False)
+    # orjson encodes in C and emits UTF-8 directly (non-ASCII kept as-is)
+    with open(structure_file, 'wb') as f:
+        f.write(orjson.dumps(parts, option=orjson.OPT_INDENT_2))
     
     print(f"\nStructure saved to {structure_file}")
     
@@ -515,6 +740,10 @@ def scrape_code_section(config: Dict) -> Tuple[int, int]:
 
 def main():
     """Main function to scrape all configured code sections"""
+    parser = argparse.ArgumentParser(description="Scrape California legal codes from leginfo")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="fetch every page from the server, ignoring the on-disk cache")
+    args = parser.parse_args()
     
     # Create base output directory
     os.makedirs(OUTPUT_BASE_DIR, exist_ok=True)
@@ -524,16 +753,18 @@ def main():
     print(f"Configuration:")
     print(f"  - Output directory: {OUTPUT_BASE_DIR}")
     print(f"  - Request delay: {REQUEST_DELAY} seconds")
+    print(f"  - HTTP cache: {'disabled' if args.no_cache else CACHE_NAME}")
     print(f"  - Code sections to scrape: {len(CODE_SECTIONS_TO_SCRAPE)}")
     
     total_successful = 0
     total_items = 0
     
     # Process each configured code section
-    for config in CODE_SECTIONS_TO_SCRAPE:
-        successful, items = scrape_code_section(config)
-        total_successful += successful
-        total_items += items
+    with SESSION.cache_disabled() if args.no_cache else contextlib.nullcontext():
+        for config in CODE_SECTIONS_TO_SCRAPE:
+            successful, items = scrape_code_section(config)
+            total_successful += successful
+            total_items += items
     
     # Final summary
     print(f"\n{'='*60}")